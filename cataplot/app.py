@@ -2,6 +2,7 @@
 cataplot main entry point
 """
 # from dataclasses import dataclass
+import logging
 import sys
 import time
 
@@ -10,7 +11,6 @@ from PySide6.QtCore import Qt, QEvent, QModelIndex, QPoint
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget,
                                QMessageBox, QInputDialog, QMenu, QTreeView)
-from PySide6.QtGui import QStandardItemModel, QStandardItem
 
 import pyqtgraph as pg
 
@@ -30,13 +30,15 @@ from . import treeview
 # from .providers import BaseProvider
 from . import provider_manager
 
+log = logging.getLogger(__name__)
+
 
 def dummy_command(_app, crumbs, progress_signal, delay:float=0):
     """
     Simulates a long-running command that reports progress through a signal.
 
     """
-    print(f"dummy_command(app={_app}, {crumbs}, delay={delay})")
+    log.debug("dummy_command(app=%s, %s, delay=%s)", _app, crumbs, delay)
     if len(crumbs) == 1:
         for i in range(int(delay / 0.1)):
             time.sleep(0.1)
@@ -92,31 +94,12 @@ class PlotManager(QWidget):
     def remove_plot(self, index):
         """Remove a plot by index."""
         plot = self.plots.pop(index)
-        self.layout.removeWidget(plot)
+        # The layout holds only the plots, in the same order as self.plots, so
+        # take the item by index instead of having removeWidget() search for it.
+        self.layout.takeAt(index)
         plot.deleteLater()
 
 
-class TreeModel(QStandardItemModel):
-    """Tree model to represent plots and curves in a tree view."""
-
-    def __init__(self):
-        super().__init__()
-        self.setHorizontalHeaderLabels(['Plots and Curves'])
-
-    def add_plot(self, name):
-        """Add a new plot entry to the tree."""
-        plot_item = QStandardItem(name)
-        plot_item.setEditable(True)  # Allow the plot name to be edited
-        self.appendRow(plot_item)
-        return plot_item
-
-    def add_curve(self, plot_item, curve_name):
-        """Add a curve under the plot entry."""
-        curve_item = QStandardItem(curve_name)
-        curve_item.setEditable(False)  # Curves are not editable
-        plot_item.appendRow(curve_item)
-
-
 class MainWindow(QMainWindow):
     def __init__(self, ui_filename, parent=None):
         super().__init__(parent)
@@ -147,7 +130,7 @@ class MainWindow(QMainWindow):
         self.con_mgr_action.triggered.connect(self.handle_con_mgr_action)
 
 
-        self.tree_model = TreeModel()
+        self.tree_model = treeview.PlotTreeModel(self)
         self.tree_view.setModel(self.tree_model)
 
         self.plot_manager = PlotManager()
@@ -174,12 +157,10 @@ class MainWindow(QMainWindow):
 
     def on_item_changed(self, top_left: QModelIndex, bottom_right: QModelIndex):
         """Update the pyqtgraph plot title when an item in the tree view is renamed."""
-        item = self.tree_model.itemFromIndex(top_left)
-
-        # Check if the item is a plot (parent is None)
-        if item and item.parent() is None:
+        # Check if the item is a plot (it has no parent)
+        if self.tree_model.is_plot(top_left):
             plot_index = top_left.row()  # Get the index of the plot
-            new_plot_name = item.text()  # Get the new plot name
+            new_plot_name = top_left.data()  # Get the new plot name
 
             # Update the corresponding plot's title in the PlotManager
             plot_widget = self.plot_manager.plots[plot_index]
@@ -187,49 +168,48 @@ class MainWindow(QMainWindow):
 
     def initialize_plots(self):
         """Create some initial plots and curves."""
-        plot1_item = self.tree_model.add_plot("Plot 1")
+        plot1_index = self.tree_model.add_plot("Plot 1")
         plot1 = self.plot_manager.add_plot("Plot 1")
-        self.tree_model.add_curve(plot1_item, "Curve 1")
+        self.tree_model.add_curve(plot1_index, "Curve 1")
         plot1.plot([0, 1, 2, 3], [10, 20, 10, 30], pen='r')  # Red curve
 
-        plot2_item = self.tree_model.add_plot("Plot 2")
+        plot2_index = self.tree_model.add_plot("Plot 2")
         plot2 = self.plot_manager.add_plot("Plot 2")
-        self.tree_model.add_curve(plot2_item, "Curve 1")
-        self.tree_model.add_curve(plot2_item, "Curve 2")
+        self.tree_model.add_curves(plot2_index, ["Curve 1", "Curve 2"])
         plot2.plot([0, 1, 2, 3], [30, 40, 20, 10], pen='g')  # Green curve
         plot2.plot([0, 1, 2, 3], [15, 25, 35, 5], pen='b')   # Blue curve
 
     def on_tree_selection_changed(self, current: QModelIndex, previous: QModelIndex):
         """Handle tree view selection changes to highlight the selected plot/curve."""
-        selected_item = self.tree_model.itemFromIndex(current)
-        if selected_item:
+        if current.isValid():
             # Handle when a plot or curve is selected
-            if selected_item.parent() is None:
+            if self.tree_model.is_plot(current):
                 # A plot is selected
-                print(f"Selected plot: {selected_item.text()}")
+                log.debug("Selected plot: %s", current.data())
             else:
                 # A curve under a plot is selected
-                print(f"Selected curve: {selected_item.text()} (under {selected_item.parent().text()})")
+                log.debug("Selected curve: %s (under %s)", current.data(),
+                          current.parent().data())
 
     def open_context_menu(self, position: QPoint):
         """Create and open the context menu when right-clicking on the tree view."""
         indexes = self.tree_view.selectedIndexes()
-        selected_item = self.tree_model.itemFromIndex(indexes[0]) if indexes else None
+        selected = indexes[0] if indexes else QModelIndex()
 
         # Create the context menu
         context_menu = QMenu(self)
 
-        if not selected_item or selected_item.parent() is None:
+        if not selected.isValid() or self.tree_model.is_plot(selected):
             # If the selected item is not a curve...
             context_menu.addAction("&Add Plot", self.add_plot)
 
-        if selected_item and selected_item.parent() is None:
+        if self.tree_model.is_plot(selected):
             # If a plot is selected...
-            context_menu.addAction("&Rename Plot", lambda: self.rename_plot(selected_item))
-            context_menu.addAction("&Delete Plot", lambda: self.delete_plot(selected_item))
+            context_menu.addAction("&Rename Plot", lambda: self.rename_plot(selected))
+            context_menu.addAction("&Delete Plot", lambda: self.delete_plot(selected))
             context_menu.addAction("&Properties")
 
-        if selected_item and selected_item.parent() is not None:
+        if selected.isValid() and not self.tree_model.is_plot(selected):
             # If the selected item is a curve...
             context_menu.addAction("&Delete Curve")
             context_menu.addAction("P&roperties")
@@ -242,26 +222,23 @@ class MainWindow(QMainWindow):
         plot_name, ok = QInputDialog.getText(self, "Add Plot", "Enter plot name:")
         if ok and plot_name:
             # Add to tree model
-            plot_item = self.tree_model.add_plot(plot_name)
+            self.tree_model.add_plot(plot_name)
             # Add to plot manager
             self.plot_manager.add_plot(plot_name)
 
-    def rename_plot(self, plot_item):
+    def rename_plot(self, plot_index: QModelIndex):
         """Rename an existing plot by entering inline edit mode."""
-        # Get the QModelIndex for the plot item
-        index = self.tree_model.indexFromItem(plot_item)
-
         # Programmatically trigger edit mode in the QTreeView
-        self.tree_view.edit(index)
+        self.tree_view.edit(plot_index)
 
-    def delete_plot(self, plot_item):
+    def delete_plot(self, plot_index: QModelIndex):
         """Delete a plot from the model and the plot manager."""
-        reply = QMessageBox.question(self, 'Delete Plot', f"Are you sure you want to delete '{plot_item.text()}'?",
+        reply = QMessageBox.question(self, 'Delete Plot', f"Are you sure you want to delete '{plot_index.data()}'?",
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
 
         if reply == QMessageBox.Yes:
             # Find the index of the plot in the model
-            index = self.tree_model.indexFromItem(plot_item).row()
+            index = plot_index.row()
             # Remove from plot manager
             self.plot_manager.remove_plot(index)
             # Remove from model
@@ -45,6 +45,9 @@ from PySide6.QtWidgets import (
 
 from . import menu_filter
 
+# Frames of the progress spinner shown in the breadcrumb label
+SPINNER = ("", ".", "..", "...")
+
 class Worker(QThread):
     """
     Worker thread that executes a command function and emits signals to update
@@ -147,16 +150,29 @@ class CommandPalette(QWidget):
         # Command list for filtering.  key: command name, values: (command_fn, args, kwargs)
         self.commands = {}
 
+        # Names of the registered commands, in registration order.  Kept in
+        # step with self.commands so that show() doesn't have to rebuild it.
+        self.command_names = []
+
         # Most recently used commands and their arguments.  key: command name,
         # value: command arguments
         self.commands_mru = {}
 
         self.crumbs = []
 
+        # The breadcrumbs joined for display in bc_label.  Kept in step with
+        # self.crumbs as crumbs are pushed and popped so that the label can be
+        # restored without re-joining the crumbs.
+        self.bc_text = ""
+
         # These are the items the palette is currently displaying.  They may
         # differ from the command list when commands return nested sub-commands.
         self.current_items = []
 
+        # The items currently set on the command model.  Used to avoid
+        # resetting the model when the list hasn't changed.
+        self.displayed_items = []
+
         # A backup of the chosen item in the command list.  This is used to
         # remove the spinner dots when the command is completed.
         self.chosen_item = None
@@ -200,32 +216,51 @@ class CommandPalette(QWidget):
         """
         # Clear all list items so that the user can't make a choice before we
         # update the list.
-        self.command_model.setStringList([])
+        self.set_displayed_items([])
 
         self.archive_worker()
 
         self.crumbs.pop()
+        self.bc_text = " > ".join(self.crumbs)
         if len(self.crumbs) == 0:
             # We just deleted the top-level breadcrumb, which is the initial
             # command name.  So just show the initial command list.
             self.show()
             return
 
-        # Update the breadcrumb label and restart the worker at the previous
-        # level.
-        self.bc_label.setText(" > ".join(self.crumbs))
+        # Restart the worker at the previous level and update the breadcrumb
+        # label.
         self.run_chosen_item()
+        self.bc_label.setText(self.bc_text)
 
     def filter_commands(self, text):
-        filtered = menu_filter.filter_list(text, self.current_items)
+        if text:
+            filtered = menu_filter.filter_list(text, self.current_items)
+        else:
+            # Query was cleared; show every item without scoring
+            filtered = list(self.current_items)
 
-        # Update the model with the filtered commands
-        self.command_model.setStringList(filtered)
+        # Update the model with the filtered commands.  Nothing to do if the
+        # filter didn't change the list (e.g. the query didn't narrow it).
+        if not self.set_displayed_items(filtered):
+            return
 
         # Highlight the first item in the list
         if filtered:
             self.command_list.setCurrentIndex(self.command_model.index(0, 0))
 
+    def set_displayed_items(self, items) -> bool:
+        """
+        Sets the items shown in the command list.  Returns False, without
+        touching the model, if the items are already being shown.
+        """
+        items = list(items)
+        if items == self.displayed_items:
+            return False
+        self.displayed_items = items
+        self.command_model.setStringList(items)
+        return True
+
     def handle_item_chosen(self, index):
         """
         User has selected a command from the list (by clicking or pressing
@@ -238,6 +273,10 @@ class CommandPalette(QWidget):
 
         self.command_input.clear()
         self.crumbs.append(self.chosen_item)
+        if self.bc_text:
+            self.bc_text = f"{self.bc_text} > {self.chosen_item}"
+        else:
+            self.bc_text = self.chosen_item
         self.run_chosen_item()
 
     def run_chosen_item(self):
@@ -251,6 +290,7 @@ class CommandPalette(QWidget):
         if len(self.crumbs) == 1:
             try:
                 self.crumbs = list(self.commands_mru.pop(cmd_name))
+                self.bc_text = " > ".join(self.crumbs)
             except KeyError:
                 pass
 
@@ -274,9 +314,7 @@ class CommandPalette(QWidget):
         Update the palette with the progress of the currently running command.
         """
         # Update the command list with the progress spinner
-        spinner = ["", ".", "..", "..."]
-        progress_text = f"{spinner[value % 4]}"
-        self.bc_label.setText(progress_text)
+        self.bc_label.setText(SPINNER[value % len(SPINNER)])
 
     def handle_result_signal(self, status, results):
         """
@@ -285,12 +323,12 @@ class CommandPalette(QWidget):
         """
         # Remove the spinner dots from the current item
         # self.command_model.setData(self.command_list.currentIndex(), self.chosen_item)
-        self.bc_label.setText(" > ".join(self.crumbs))
+        self.bc_label.setText(self.bc_text)
 
         if status == 'sub-command':
             # Set commands to the results of the sub-command
             self.current_items = results
-            self.command_model.setStringList(self.current_items)
+            self.set_displayed_items(self.current_items)
             self.command_list.setCurrentIndex(self.command_model.index(0, 0))
         else:
             # The command has completed.  Hide the palette.
@@ -314,6 +352,8 @@ class CommandPalette(QWidget):
               same keyword arguments that were specified when the command was
               registered.
         """
+        if command_name not in self.commands:
+            self.command_names.append(command_name)
         self.commands[command_name] = (command_fn, kwargs)
 
     def set_commands(self, commands:dict):
@@ -328,6 +368,7 @@ class CommandPalette(QWidget):
         """
         # Store all commands for filtering
         self.commands = commands
+        self.command_names = list(commands)
 
     def move_selection_up(self):
         """
@@ -374,8 +415,9 @@ class CommandPalette(QWidget):
         Hides the command palette
         """
         # Reset the command list
-        self.command_model.setStringList(self.commands)
+        self.set_displayed_items(self.command_names)
         self.crumbs = []
+        self.bc_text = ""
         self.setVisible(False)
 
     def archive_worker(self):
@@ -403,8 +445,8 @@ class CommandPalette(QWidget):
         self.bc_label.setText("")
 
         # Populate current items from commands
-        self.current_items = self.commands.keys()
-        self.command_model.setStringList(self.current_items)
+        self.current_items = self.command_names
+        self.set_displayed_items(self.current_items)
 
         # Highlight the first item in the list
         if self.command_model.rowCount() > 0:
@@ -3,40 +3,68 @@ This module provides functions for filtering and ranking a list of strings based
 on a pattern string.  It is intended to be used in a command palette or similar
 interface where the user types a query string to filter a list of items.
 """
-import re
 
-def build_regex(query:str) -> str:
-    """
-    Builds the regular expression for scoring matches.
-    """
-    return '.*?'.join(map(re.escape, list(query)))
+# Characters after which a matched character is considered to start a word
+_BOUNDARY_CHARS = frozenset(' _-/.')
 
-def score(string:str, regex:str, ignorecase:bool=True) -> float:
+# Scoring weights, loosely modelled on the fzf / libfuzzy scorers
+_MATCH_SCORE = 16
+_BOUNDARY_BONUS = 15
+_CONSECUTIVE_BONUS = 10
+_GAP_PENALTY = 1
+
+def score(string:str, query:str, ignorecase:bool=True) -> float:
     """
-    Scores a string based on how well it matches the pattern string. Returns
-    a score between 0 and 100.  The higher the score, the better the match.
-    Factors that affect the score include the position and length of the
-    match: matches that occur earlier in the string and are longer score
+    Scores a string based on how well it matches the query string. Returns 0
+    if the characters of the query do not all appear, in order, in the string;
+    otherwise returns a positive score.  The higher the score, the better the
+    match.
+
+    The string is scanned once from left to right.  Each matched character
+    earns a bonus if it starts a word (it is the first character, follows one
+    of ' _-/.', or is an uppercase letter following a lowercase one) and
+    another if it immediately follows the previous match.  Each skipped
+    character costs a small penalty, so earlier and tighter matches score
     higher.
     """
     if ignorecase:
-        match = re.search(regex, string, re.IGNORECASE)
+        haystack = string.lower()
+        needle = query.lower()
     else:
-        match = re.search(regex, string)
-    if match is None:
-        return 0
-    # Derive a score based on the position and length of the match
-    pos_match = match.start() + 1  # +1 to avoid division by zero
-    len_match = (match.end() - match.start()) + 1
-    return 100.0 / (pos_match * len_match)
+        haystack = string
+        needle = query
+    if not needle:
+        return float(_MATCH_SCORE)
+
+    total = 0
+    query_pos = 0
+    prev = ''
+    prev_matched = False
+    for char, orig in zip(haystack, string):
+        if char == needle[query_pos]:
+            total += _MATCH_SCORE
+            if prev_matched:
+                total += _CONSECUTIVE_BONUS
+            if not prev or prev in _BOUNDARY_CHARS or (prev.islower() and orig.isupper()):
+                total += _BOUNDARY_BONUS
+            query_pos += 1
+            if query_pos == len(needle):
+                # A complete match always ranks above a non-match, no matter
+                # how many characters were skipped.
+                return float(max(total, 1))
+            prev_matched = True
+        else:
+            total -= _GAP_PENALTY
+            prev_matched = False
+        prev = orig
+    return 0
 
 def rank_list(query:str, items: list[str]) -> list[tuple[str, float]]:
     """
     Ranks a list of items based on how well they match the pattern string.
     Returns a list of tuples with the item and its corresponding score.
     """
-    regex = build_regex(query)
-    ranked = [(item, score(item, regex)) for item in items]
+    ranked = [(item, score(item, query)) for item in items]
     ranked.sort(key=lambda x: x[1], reverse=True)
     return ranked
 
@@ -44,7 +72,22 @@ def filter_list(query:str, items:list[str]) -> list[str]:
     """
     Filters and ranks a list of items based on how well they match the query
     string. Returns a list of items that have a non-zero score, sorted by
-    score.
+    score.  An empty query matches every item, in the original order.
+
+    If the query appears as a contiguous substring of any item, only those
+    items are returned, ordered by where the substring occurs.  The fuzzy
+    scorer is used only when there are no substring matches.
     """
+    if not query:
+        return list(items)
+
+    # Fast path: plain substring search is much cheaper than fuzzy scoring
+    needle = query.lower()
+    hits = [(item, item.lower().find(needle)) for item in items]
+    hits = [(item, pos) for item, pos in hits if pos >= 0]
+    if hits:
+        hits.sort(key=lambda x: x[1])
+        return [item for item, _pos in hits]
+
     ranked = rank_list(query, items)
     return [item for item, score in ranked if score > 0]
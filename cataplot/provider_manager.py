@@ -5,8 +5,6 @@ edit, and delete data providers, and test the connection settings for each
 provider.
 """
 
-import sys
-
 # pylint: disable=no-name-in-module
 from PySide6.QtCore import Qt, QModelIndex, QAbstractListModel
 from PySide6.QtWidgets import QMainWindow, QMenu
@@ -14,6 +12,18 @@ from PySide6.QtGui import QAction
 
 from .pyside_ui_loader import load_ui
 
+# It is assumed that the UI file has the same name as the module
+UI_FILENAME = __file__.replace('.py', '.ui')
+
+# Qt enum values used by the model callbacks, which Qt calls once per visible
+# row per repaint.  Binding them here avoids an attribute lookup on the Qt
+# namespace for each call.
+_DISPLAY_ROLE = Qt.DisplayRole
+_EDIT_ROLE = Qt.EditRole
+_HORIZONTAL = Qt.Horizontal
+_NO_ITEM_FLAGS = Qt.NoItemFlags
+_ITEM_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
 
 class ListOfDictModel(QAbstractListModel):
     """
@@ -29,25 +39,34 @@ class ListOfDictModel(QAbstractListModel):
     def __init__(self, parent=None, items:list|None=None, header:str=''):
         super().__init__(parent)
         self._data = items or []
+        # Names of all providers in _data, for constant-time lookups by name.
+        # Provider names are unique.
+        self._names = {x['name'] for x in self._data}
         self.header = header
 
     def headerData(self, section, orientation, role):
         """
         Returns the header name, which is always 'Provider'.
         """
-        if (orientation == Qt.Horizontal) and (role == Qt.DisplayRole):
+        if (orientation == _HORIZONTAL) and (role == _DISPLAY_ROLE):
             return self.header
         return super().headerData(section, orientation, role)
 
     def setData(self, index, value, role=Qt.EditRole):
         """
         Sets model data at the specified index.
-        Returns True of the value was successfully assigned.
+        Returns True of the value was successfully assigned.  Renaming a
+        provider to the name of another provider is refused.
         """
-        if index.isValid() and role == Qt.EditRole:
+        if index.isValid() and role == _EDIT_ROLE:
             # It is assumed that all dicts in _data have a 'name' key
-            self._data[index.row()]['name'] = value
-            self.dataChanged.emit(index, index, [Qt.DisplayRole])
+            item = self._data[index.row()]
+            if value != item['name'] and value in self._names:
+                return False
+            self._names.discard(item['name'])
+            item['name'] = value
+            self._names.add(value)
+            self.dataChanged.emit(index, index, [_DISPLAY_ROLE])
             return True
         return False
 
@@ -55,7 +74,7 @@ class ListOfDictModel(QAbstractListModel):
         """
         Returns model data at the specified index.
         """
-        if (not index.isValid()) or (role != Qt.DisplayRole):
+        if (not index.isValid()) or (role != _DISPLAY_ROLE):
             return None
         return self._data[index.row()]['name']
 
@@ -71,25 +90,37 @@ class ListOfDictModel(QAbstractListModel):
         order to make treeview items editable.
         """
         if not index.isValid():
-            return Qt.NoItemFlags
-        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+            return _NO_ITEM_FLAGS
+        return _ITEM_FLAGS
+
+    def load(self, items:list):
+        """
+        Replaces the model's list of providers with ``items``.  The change is
+        reported to attached views as a single model reset, so they do one
+        layout pass instead of one per row.
+        """
+        self.beginResetModel()
+        self._data = items
+        self._names = {x['name'] for x in items}
+        self.endResetModel()
 
     def new(self):
         """
         Adds a new Provider instance to the list of providers in the model.
         """
         name = 'New Provider'
-        if name in [x['name'] for x in self._data]:
+        if name in self._names:
             idx = 0
             while True:
                 num_name = f'{name} ({idx})'
-                if num_name not in [x['name'] for x in self._data]:
+                if num_name not in self._names:
                     name = num_name
                     break
                 idx += 1
 
         self.beginInsertRows(QModelIndex(), len(self._data), len(self._data))
         self._data.append({'name': name, 'provider_type': '', 'config': {}})
+        self._names.add(name)
         self.endInsertRows()
 
     def delete(self, index):
@@ -98,7 +129,7 @@ class ListOfDictModel(QAbstractListModel):
         the specified index.
         """
         self.beginRemoveRows(index, index.row(), index.row())
-        self._data.pop(index.row())
+        self._names.discard(self._data.pop(index.row())['name'])
         self.endRemoveRows()
 
 def get_centered_position(parent_window: QMainWindow, child_window: QMainWindow):
@@ -113,15 +144,15 @@ def get_centered_position(parent_window: QMainWindow, child_window: QMainWindow)
 class ProviderManager(QMainWindow):
     def __init__(self, parent=None):
         QMainWindow.__init__(self, parent)
-        module_root = sys.modules[__name__].__file__
-        # It is assumed that the UI file has the same name as the module
-        ui_filename = module_root.replace('.py', '.ui')
-        load_ui(ui_filename, self)
+        load_ui(UI_FILENAME, self)
 
         # Model for tree view
         self.table_model = ListOfDictModel(parent=self.tree_view, header='Provider')
         # self.table_model.dataChanged.connect(self.data_changed)
         self.tree_view.setModel(self.table_model)
+        # Every row is a single line of text.  Telling the view lets it lay
+        # out rows without calling back into the Python model for each one.
+        self.tree_view.setUniformRowHeights(True)
 
         # Right click tree view
         self.tree_view.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -173,7 +204,8 @@ class ProviderManager(QMainWindow):
         # idx = self.tree_view.currentIndex()
         if self.table_model.rowCount(None) == 0:
             self.table_model.new()
-            self.tree_view.setCurrentIndex(self.table_model.createIndex(self.table_model.rowCount(None)-1, 0, None))
+            # The new provider is the only row
+            self.tree_view.setCurrentIndex(self.table_model.createIndex(0, 0, None))
 
         self.update_model()
 
@@ -232,18 +264,19 @@ class ProviderManager(QMainWindow):
         Removes the currently selected row from the provider list.
         """
         idx = self.tree_view.currentIndex()
-        if idx.row() >= self.table_model.rowCount(None):
+        row_count = self.table_model.rowCount(None)
+        if idx.row() >= row_count:
             # No row is selected, or no more items to delete.
             return
         self.table_model.delete(idx)
+        row_count -= 1
 
         # If the deleted row was the last row, highlight the row above it so
         # that the user can press the delete button repeatedly in order to
         # remove many items rapidly.
         idx = self.tree_view.currentIndex()
-        if idx.row() >= self.table_model.rowCount(None):
-            if self.table_model.rowCount(None) > 0:
-                self.tree_view.setCurrentIndex(self.table_model.createIndex(self.table_model.rowCount(None)-1, 0, None))
+        if row_count > 0 and idx.row() >= row_count:
+            self.tree_view.setCurrentIndex(self.table_model.createIndex(row_count-1, 0, None))
 
     def test_clicked(self):
         """
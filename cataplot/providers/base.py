@@ -16,20 +16,58 @@ class BaseProvider(ABC):
         else:
             self.set_config(config)
 
+    def _schema(self) -> dict:
+        """
+        Returns the configuration schema for this provider.  The schema is
+        assumed to be the same for every instance of a class, so it is built
+        once per class by get_config_schema() and cached on the class.
+        """
+        cls = type(self)
+        # Look in the class's own namespace so that subclasses don't pick up
+        # a schema cached on their base class.
+        schema = cls.__dict__.get('_cached_schema')
+        if schema is None:
+            schema = self.get_config_schema()
+            cls._cached_schema = schema
+        return schema
+
+    def _validation_plan(self) -> tuple[dict, tuple]:
+        """
+        Returns a (dtypes, required) tuple derived from the configuration
+        schema: a dictionary mapping each parameter name to its expected type,
+        and a tuple of the names of the required parameters.  Like the schema,
+        the plan is built once per class and cached on the class.
+        """
+        cls = type(self)
+        plan = cls.__dict__.get('_cached_validation_plan')
+        if plan is None:
+            schema = self._schema()
+            dtypes = {key: params['dtype'] for key, params in schema.items()}
+            required = tuple(key for key, params in schema.items()
+                             if params.get("required"))
+            plan = (dtypes, required)
+            cls._cached_validation_plan = plan
+        return plan
+
     def _generate_default_config(self):
         """
         Generates a default configuration for this provider based on the
         configuration schema.  Returns a dictionary with the default values for
-        each parameter.
+        each parameter.  The defaults are built once per class and cached on
+        the class; each call returns a new copy.
         """
-        schema = self.get_config_schema()
-        config = {}
-        for key, params in schema.items():
-            if "default" in params:
-                config[key] = params["default"]
-            else:
-                config[key] = None
-        return config
+        cls = type(self)
+        defaults = cls.__dict__.get('_cached_defaults')
+        if defaults is None:
+            schema = self._schema()
+            defaults = {}
+            for key, params in schema.items():
+                if "default" in params:
+                    defaults[key] = params["default"]
+                else:
+                    defaults[key] = None
+            cls._cached_defaults = defaults
+        return defaults.copy()
 
     def get_config(self):
         """
@@ -42,32 +80,35 @@ class BaseProvider(ABC):
         Sets the configuration for this provider.  The config parameter is a
         dictionary containing the configuration parameters to set.
         """
-        schema = self.get_config_schema()
+        dtypes, _required = self._validation_plan()
 
         # Check that all supplied parameters are valid and have the correct type
         for key, value in config.items():
-            if key not in schema:
+            expected_type = dtypes.get(key)
+            if expected_type is None:
                 raise ValueError(f"Unknown configuration parameter: {key}")
-            expected_type = schema[key]['dtype']
             if not isinstance(value, expected_type):
                 raise TypeError(f"Incorrect type for {key}: expected {expected_type}")
 
         # Check that all required parameters are present
-        self.validate_config()
+        self.validate_config(config)
 
         # It is safe to set the configuration now
         self._config = config
 
-    def validate_config(self):
+    def validate_config(self, config:dict|None=None):
         """
         Checks that the configuration is valid by ensuring that all required
         parameters are present.  Raises a ValueError if any required parameters
-        are missing.
+        are missing.  Validates the given config dictionary, or the provider's
+        current configuration if config is None.
         """
-        schema = self.get_config_schema()
+        if config is None:
+            config = self._config
+        _dtypes, required = self._validation_plan()
 
-        for key, params in schema.items():
-            if params.get("required") and self._config.get(key) is None:
+        for key in required:
+            if config.get(key) is None:
                 raise ValueError(f"Missing required configuration parameter: {key}")
 
     @abstractmethod
@@ -9,7 +9,7 @@ from .base import BaseProvider
 
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class ServerMetric:
     """
     Data class for server metrics.
@@ -18,7 +18,7 @@ class ServerMetric:
     description: str
     units: str
 
-@dataclass
+@dataclass(slots=True)
 class ServerHost:
     """
     Data class for server hosts.
@@ -52,8 +52,18 @@ if __name__ == '__main__':
     main()
 """
 
-from PySide6.QtCore import QMetaObject   # pylint: disable=no-name-in-module
-from PySide6.QtUiTools import QUiLoader  # pylint: disable=no-name-in-module
+import importlib
+import os
+import subprocess
+import sys
+
+# pylint: disable=no-name-in-module
+from PySide6.QtCore import QMetaObject, QBuffer, QByteArray, QIODevice
+from PySide6.QtUiTools import QUiLoader
+
+# Contents of the .ui files read so far.  key: file name, value: (modification
+# time in ns, file contents).
+_UI_CACHE: dict[str, tuple[int, bytes]] = {}
 
 class UiLoader(QUiLoader):
     """
@@ -86,6 +96,9 @@ class UiLoader(QUiLoader):
         QUiLoader.__init__(self, baseinstance)
         self.baseinstance = baseinstance
         self.custom_widgets = custom_widgets
+        # availableWidgets() builds a new list on each call, and createWidget
+        # is called for every widget in the UI
+        self._available = frozenset(self.availableWidgets())
 
     # pylint: disable=invalid-name
     def createWidget(self, class_name, parent=None, name=''):
@@ -100,7 +113,7 @@ class UiLoader(QUiLoader):
             return self.baseinstance
 
         else:
-            if class_name in self.availableWidgets():
+            if class_name in self._available:
                 # create a new widget for child widgets
                 widget = QUiLoader.createWidget(self, class_name, parent, name)
 
@@ -129,6 +142,81 @@ class UiLoader(QUiLoader):
             return widget
 
 
+def read_ui(uifile):
+    """
+    Returns the contents of ``uifile`` as bytes.  The contents are cached, and
+    the file is only read again if its modification time has changed.
+    """
+    mtime = os.stat(uifile).st_mtime_ns
+    cached = _UI_CACHE.get(uifile)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(uifile, 'rb') as infile:
+        data = infile.read()
+    _UI_CACHE[uifile] = (mtime, data)
+    return data
+
+
+def load_compiled_ui(uifile, baseinstance):
+    """
+    Sets up ``baseinstance`` from a module compiled from ``uifile`` by
+    ``pyside6-uic`` (see the ``ui`` target in the Makefile), which avoids
+    parsing the XML at runtime.
+
+    The compiled module for ``<package>/<name>.ui`` is ``<package>.ui_<name>``,
+    where ``<package>`` is the package containing the class of
+    ``baseinstance``.  The module is only used if it is at least as new as the
+    ``.ui`` file, so a stale build is never picked up.
+
+    As with :class:`UiLoader`, each object created by the UI is set as an
+    attribute on ``baseinstance``.  Returns True if the compiled module was
+    used, or False if there is no usable compiled module.
+    """
+    package = type(baseinstance).__module__.rpartition('.')[0]
+    if not package:
+        return False
+    stem = os.path.splitext(os.path.basename(uifile))[0]
+    try:
+        module = importlib.import_module(f'{package}.ui_{stem}')
+        if os.path.getmtime(module.__file__) < os.path.getmtime(uifile):
+            return False
+    except (ImportError, OSError):
+        return False
+
+    ui_classes = [obj for name, obj in vars(module).items() if name.startswith('Ui_')]
+    if len(ui_classes) != 1:
+        return False
+
+    # setupUi() also calls QMetaObject.connectSlotsByName() on baseinstance
+    ui = ui_classes[0]()
+    ui.setupUi(baseinstance)
+    for name, obj in vars(ui).items():
+        setattr(baseinstance, name, obj)
+    return True
+
+
+def compile_ui_files(paths):
+    """
+    Compiles each of the ``.ui`` files in ``paths`` with ``pyside6-uic`` into
+    the module that :func:`load_compiled_ui` looks for: ``<dir>/<name>.ui`` is
+    compiled to ``<dir>/ui_<name>.py``.  Files whose compiled module is already
+    up to date are skipped.  Raises ``subprocess.CalledProcessError`` if
+    ``pyside6-uic`` fails.
+
+    Run as ``python -m cataplot.pyside_ui_loader cataplot/*.ui``, which is what
+    the ``ui`` target in the Makefile does.
+    """
+    for uifile in paths:
+        directory, filename = os.path.split(uifile)
+        stem = os.path.splitext(filename)[0]
+        target = os.path.join(directory, f'ui_{stem}.py')
+        if (os.path.exists(target)
+                and os.path.getmtime(target) >= os.path.getmtime(uifile)):
+            continue
+        subprocess.run(['pyside6-uic', '--from-imports', uifile, '-o', target],
+                       check=True)
+
+
 def load_ui(uifile, baseinstance=None, custom_widgets=None,
             working_directory=None):
     """
@@ -154,15 +242,29 @@ def load_ui(uifile, baseinstance=None, custom_widgets=None,
     created user interface, so you can implemented your slots according to its
     conventions in your widget class.
 
+    If ``baseinstance`` is given and a compiled module for ``uifile`` exists
+    (see :func:`load_compiled_ui`), it is used instead of parsing ``uifile``.
+    In that case custom widgets are imported by the compiled module, and
+    ``custom_widgets`` is not used.
+
     Return ``baseinstance``, if ``baseinstance`` is not ``None``.  Otherwise
     return the newly created instance of the user interface.
     """
+    if baseinstance is not None and load_compiled_ui(uifile, baseinstance):
+        return baseinstance
 
     loader = UiLoader(baseinstance, custom_widgets)
 
     if working_directory is not None:
         loader.setWorkingDirectory(working_directory)
 
-    widget = loader.load(uifile)
+    buffer = QBuffer()
+    buffer.setData(QByteArray(read_ui(uifile)))
+    buffer.open(QIODevice.ReadOnly)
+    widget = loader.load(buffer)
     QMetaObject.connectSlotsByName(widget)
     return widget
+
+
+if __name__ == '__main__':
+    compile_ui_files(sys.argv[1:])
@@ -1,12 +1,180 @@
 """
-Subclass of QTreeView with a size hint to set the initial width.
+Subclass of QTreeView with a size hint to set the initial width, and the model
+of plots and curves that it displays.
 """
+from dataclasses import dataclass, field
+
 # pylint: disable=no-name-in-module
+from PySide6.QtCore import Qt, QAbstractItemModel, QModelIndex
 from PySide6.QtWidgets import QTreeView
 
+# Number of curves added to the tree each time a plot's children are fetched
+FETCH_BATCH = 256
+
 class TreeView(QTreeView):
     def sizeHint(self):
         size = super().sizeHint()
         # NB: Percent
         size.setWidth(20)
         return size
+
+
+@dataclass(slots=True, eq=False)
+class PlotNode:
+    """
+    A plot and the names of its curves.  Only the first `fetched` curves have
+    been made visible to the view so far.  `row` is the plot's row in the
+    model, kept up to date by PlotTreeModel.
+    """
+    name: str
+    row: int = 0
+    curves: list[str] = field(default_factory=list)
+    fetched: int = 0
+
+
+class PlotTreeModel(QAbstractItemModel):
+    """
+    Tree model of plots and their curves.  Plots are top-level rows and curves
+    are their children.
+
+    Curves are plain strings rather than QStandardItems.  Curves added with
+    add_curves() are handed to the view in batches through
+    canFetchMore/fetchMore as the plot is expanded and scrolled, so a plot with
+    many curves costs nothing until they are shown.
+
+    The internal pointer of a curve's index is its PlotNode.  Plot indexes have
+    no internal pointer.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.plots: list[PlotNode] = []
+
+    def add_plot(self, name) -> QModelIndex:
+        """Add a new plot entry to the tree and return its index."""
+        row = len(self.plots)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.plots.append(PlotNode(name, row))
+        self.endInsertRows()
+        return self.index(row, 0)
+
+    def add_curve(self, plot_index:QModelIndex, curve_name):
+        """Add a curve under the plot entry."""
+        node = self.plots[plot_index.row()]
+        if node.fetched < len(node.curves):
+            # The view hasn't caught up with this plot's curves yet, so the new
+            # curve will be fetched with the rest.
+            node.curves.append(curve_name)
+            return
+        row = len(node.curves)
+        self.beginInsertRows(plot_index, row, row)
+        node.curves.append(curve_name)
+        node.fetched += 1
+        self.endInsertRows()
+
+    def add_curves(self, plot_index:QModelIndex, names):
+        """
+        Add several curves under the plot entry.  The curves are only stored
+        here; the view fetches them with fetchMore when it needs them.
+        """
+        node = self.plots[plot_index.row()]
+        had_curves = bool(node.curves)
+        node.curves.extend(names)
+        if not had_curves and node.curves:
+            # Let views know that the plot now has children, so that they show
+            # an expand indicator for it.  No rows have been inserted, so no
+            # indexes change.
+            self.layoutAboutToBeChanged.emit()
+            self.layoutChanged.emit()
+
+    def is_plot(self, index:QModelIndex) -> bool:
+        """Returns True if index refers to a plot rather than a curve."""
+        return index.isValid() and index.internalPointer() is None
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column)
+        return self.createIndex(row, column, self.plots[parent.row()])
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer()
+        if node is None:
+            return QModelIndex()
+        return self.createIndex(node.row, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.plots)
+        if self.is_plot(parent):
+            return self.plots[parent.row()].fetched
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        # Plots whose curves haven't been fetched yet still have children, so
+        # that the view draws an expand indicator for them.
+        if self.is_plot(parent):
+            return bool(self.plots[parent.row()].curves)
+        return super().hasChildren(parent)
+
+    def canFetchMore(self, parent):
+        if self.is_plot(parent):
+            node = self.plots[parent.row()]
+            return node.fetched < len(node.curves)
+        return False
+
+    def fetchMore(self, parent):
+        node = self.plots[parent.row()]
+        count = min(FETCH_BATCH, len(node.curves) - node.fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(parent, node.fetched, node.fetched + count - 1)
+        node.fetched += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        node = index.internalPointer()
+        if node is None:
+            return self.plots[index.row()].name
+        return node.curves[index.row()]
+
+    def setData(self, index, value, role=Qt.EditRole):
+        # Only plot names can be edited
+        if role != Qt.EditRole or not self.is_plot(index) or not value:
+            return False
+        self.plots[index.row()].name = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if self.is_plot(index):
+            # Allow the plot name to be edited
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return 'Plots and Curves'
+        return None
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        # Only plots can be removed
+        if parent.isValid() or row < 0 or row + count > len(self.plots):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self.plots[row:row + count]
+        for node in self.plots[row:]:
+            node.row -= count
+        self.endRemoveRows()
+        return True
@@ -1,5 +1,5 @@
 # pylint: disable=no-name-in-module
-from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit
+from PySide6.QtWidgets import QApplication, QWidget, QFormLayout, QLineEdit
 from PySide6.QtCore import Qt
 
 class DictView(QWidget):
@@ -9,25 +9,23 @@ class DictView(QWidget):
         self.init_ui()
 
     def init_ui(self):
-        layout = QVBoxLayout()
+        # One form row (key label, value edit) per dict item
+        layout = QFormLayout()
+        layout.setLabelAlignment(Qt.AlignRight | Qt.AlignVCenter)
 
         for key, value in self.data_dict.items():
-            row_layout = QHBoxLayout()
-
-            # QLabel for the key
-            key_label = QLabel(key)
-            key_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            row_layout.addWidget(key_label)
-
-            # QLineEdit for the value
+            # QLineEdit for the value.  The key is stored on the edit so that
+            # a single slot can handle every edit.
             value_edit = QLineEdit(str(value))
-            value_edit.textChanged.connect(lambda text, k=key: self.update_dict(k, text))
-            row_layout.addWidget(value_edit)
-
-            layout.addLayout(row_layout)
+            value_edit.setProperty("dict_key", key)
+            value_edit.textChanged.connect(self.on_text_changed)
+            layout.addRow(key, value_edit)
 
         self.setLayout(layout)
 
+    def on_text_changed(self, text):
+        self.update_dict(self.sender().property("dict_key"), text)
+
     def update_dict(self, key, value):
         self.data_dict[key] = value
         print(f"Updated {key}: {value}")
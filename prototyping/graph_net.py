@@ -2,6 +2,7 @@
 Demonstrates how to create a time series plot that fetches more data when the
 user pans to the edge of the available data.
 """
+import math
 import time
 import sys
 
@@ -11,7 +12,30 @@ from PySide6.QtCore import QTimer
 import pyqtgraph as pg
 import numpy as np
 
-import numpy as np
+# generate_data runs on every pan/zoom, so look these up once rather than as
+# attributes of np on each call.
+_np_sin = np.sin
+_np_arange = np.arange
+_np_ceil = np.ceil
+_np_floor = np.floor
+_np_empty = np.empty
+_np_multiply = np.multiply
+
+# Numba is optional.  If it's installed, wide ranges are generated by a compiled
+# kernel that computes x and sin(x) in one parallel pass.  Below NJIT_THRESHOLD
+# points the call overhead isn't worth it, so NumPy is used.
+NJIT_THRESHOLD = 4096
+try:
+    from numba import njit, prange
+except ImportError:
+    _generate_kernel = None
+else:
+    @njit(parallel=True, cache=True)
+    def _generate_kernel(xmin, n, grid, out_x, out_y):
+        for i in prange(n):
+            x = xmin + i * grid
+            out_x[i] = x
+            out_y[i] = math.sin(x)
 
 def generate_data(xmin: float, xmax: float, grid:float=0.1,
                   align:str='center') -> tuple[np.ndarray, np.ndarray]:
@@ -36,15 +60,24 @@ def generate_data(xmin: float, xmax: float, grid:float=0.1,
     """
     if align == 'right':
         # Round xmin up to the nearest multiple of grid
-        xmin = np.ceil(xmin / grid) * grid
+        xmin = _np_ceil(xmin / grid) * grid
     elif align == 'left':
-        xmax = np.floor(xmax / grid) * grid
+        xmax = _np_floor(xmax / grid) * grid
     elif align == 'center':
-        xmin = np.ceil(xmin / grid) * grid
-        xmax = np.floor(xmax / grid) * grid
-
-    x_values = np.arange(xmin, xmax, grid)
-    y_values = np.sin(x_values)
+        xmin = _np_ceil(xmin / grid) * grid
+        xmax = _np_floor(xmax / grid) * grid
+
+    # Same points as np.arange(xmin, xmax, grid), but computed from an integer
+    # count so that the output size is known before anything is allocated.
+    n = max(int(_np_ceil((xmax - xmin) / grid)), 0)
+    x_values = _np_empty(n)
+    y_values = _np_empty(n)
+    if _generate_kernel is not None and n > NJIT_THRESHOLD:
+        _generate_kernel(float(xmin), n, float(grid), x_values, y_values)
+    else:
+        _np_multiply(_np_arange(n), grid, out=x_values)
+        x_values += xmin
+        _np_sin(x_values, out=y_values)
 
     # if x_values.any():
     #     print(f"Generated data for x range [{x_values[0]}, {x_values[-1]}]")
@@ -88,14 +121,31 @@ class TimeSeriesPlot(QWidget):
         self.plot_widget = pg.PlotWidget()
         layout.addWidget(self.plot_widget)
 
+        # The plotted data lives in xbuf[start:stop] and ybuf[start:stop], with
+        # free space on both sides so that data revealed by panning can be
+        # written in place.  self.x and self.y are views of the used region.
+        self.xbuf = np.empty(1 << 14)
+        self.ybuf = np.empty(1 << 14)
+        self.start = self.stop = len(self.xbuf) // 2
+
         # Generate initial time-series data
         # self.x = np.linspace(0, 100, 1000)
         # self.y = np.sin(self.x)
-        self.x, self.y = generate_data(0, 5, align='right', grid=.3)
+        self.place_data(*generate_data(0, 5, align='right', grid=.3), left=False)
+
+        # The x range [x_min, x_max) that self.x and self.y cover.  Data is only
+        # generated for the parts of a new view range outside this range.
+        self.data_range = [0, 5]
 
         # Plot the initial data.  Show dots at each data point.
         self.plot = self.plot_widget.plot(self.x, self.y, pen=None, symbol='o')
 
+        # Only draw the points inside the view, and let pyqtgraph thin them out
+        # to about one per pixel when zoomed out.  The full data is still kept
+        # in self.x and self.y.
+        self.plot.setClipToView(True)
+        self.plot.setDownsampling(auto=True, method='peak')
+
         # Connect to the signal emitted when the user pans or zooms
         self.plot_widget.getViewBox().sigRangeChanged.connect(self.on_view_range_changed)
 
@@ -106,21 +156,102 @@ class TimeSeriesPlot(QWidget):
         self.tmp_counter = 0
 
         self.last_range_change_time = time.monotonic()
-        self.timer = None
+
+        # Timer used to defer updates while range changes arrive in quick
+        # succession.  Restarting it pushes the update back, so a burst of
+        # changes results in one update for the last range.
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.on_timer)
         self.deferred_range = None
 
     def on_timer(self):
-        self.timer.stop()
-        self.timer = None
-        # self.on_view_range_changed(None, self.deferred_range, deferred=True)
         self.update_data_for_new_range(self.deferred_range)
 
+    def grow_buffers(self, n):
+        """
+        Makes room for at least n more points on either side of the existing
+        data.  If the buffers are big enough, the data is just moved back to
+        the middle of them, since panning uses up space on one side while
+        trimming frees it on the other.  Otherwise the buffers are reallocated
+        at least twice as big, so that growing them is rare.
+        """
+        count = self.stop - self.start
+        needed = 2 * (count + n)
+        if needed <= len(self.xbuf):
+            offset = (len(self.xbuf) - count) // 2
+            for buf in (self.xbuf, self.ybuf):
+                # NumPy copies correctly when the two regions overlap
+                buf[offset:offset + count] = buf[self.start:self.stop]
+        else:
+            size = max(2 * len(self.xbuf), needed)
+            offset = (size - count) // 2
+            for name in ('xbuf', 'ybuf'):
+                buf = np.empty(size)
+                buf[offset:offset + count] = getattr(self, name)[self.start:self.stop]
+                setattr(self, name, buf)
+        self.start, self.stop = offset, offset + count
+
+    def place_data(self, new_x, new_y, left):
+        """
+        Writes new points into the buffers immediately to the left (if left is
+        True) or right of the existing data.
+        """
+        n = len(new_x)
+        if left:
+            if self.start < n:
+                self.grow_buffers(n)
+            self.start -= n
+            self.xbuf[self.start:self.start + n] = new_x
+            self.ybuf[self.start:self.start + n] = new_y
+        else:
+            if len(self.xbuf) - self.stop < n:
+                self.grow_buffers(n)
+            self.xbuf[self.stop:self.stop + n] = new_x
+            self.ybuf[self.stop:self.stop + n] = new_y
+            self.stop += n
+        self.x = self.xbuf[self.start:self.stop]
+        self.y = self.ybuf[self.start:self.stop]
 
     def update_data_for_new_range(self, view_range):
-        self.x, self.y = generate_data(view_range[0][0],
-                                       view_range[0][1],
-                                       align='right',
-                                       grid=.3)
+        """
+        Generates data for the parts of the new view range that aren't already
+        covered, and discards data that is far outside the view.  The work done
+        is proportional to how far the view moved rather than to its width.
+
+        view_range format: [[x_min, x_max], [y_min, y_max]]
+        """
+        x_min, x_max = view_range[0]
+        data_min, data_max = self.data_range
+
+        if x_max < data_min or x_min > data_max:
+            # The view doesn't overlap the existing data, so there is nothing
+            # to extend.  Start again from the view range.
+            self.start = self.stop = len(self.xbuf) // 2
+            self.place_data(*generate_data(x_min, x_max, align='right', grid=.3),
+                            left=False)
+            data_min, data_max = x_min, x_max
+        else:
+            for needed_range in get_needed_x_range(self.data_range, view_range[0]):
+                new_x, new_y = generate_data(needed_range[0], needed_range[1],
+                                             align='right', grid=.3)
+                # Determine whether the new data goes to the left or right of
+                # the existing data
+                self.place_data(new_x, new_y, left=needed_range[0] < data_min)
+            data_min, data_max = min(data_min, x_min), max(data_max, x_max)
+
+        # Keep at most one view width of data either side of the view, so that
+        # memory use doesn't grow as the user pans.
+        pad = x_max - x_min
+        data_min, data_max = max(data_min, x_min - pad), min(data_max, x_max + pad)
+        start, stop = np.searchsorted(self.x, [data_min, data_max])
+        self.start, self.stop = self.start + start, self.start + stop
+        self.x = self.xbuf[self.start:self.stop]
+        self.y = self.ybuf[self.start:self.stop]
+        self.data_range = [data_min, data_max]
+
+        self.view_range = view_range
+
         # Update the plot with the new data
         self.plot.setData(self.x, self.y)
 
@@ -135,47 +266,16 @@ class TimeSeriesPlot(QWidget):
             # It hasn't been long enough since the last range change.  Defer the
             # update until later (to avoid fetching data quite so often) using
             # a QTimer.
-            if self.timer is not None:
-                self.timer.stop()
-            self.timer = QTimer()
-            self.timer.timeout.connect(self.on_timer)
-            self.timer.start(100)  # 100 ms
             self.deferred_range = view_range
+            self.timer.start(100)  # 100 ms
             return
 
         self.last_range_change_time = now
 
-        self.update_data_for_new_range(view_range)
+        # Any deferred update is for an older range than this one
+        self.timer.stop()
 
-        # self.tmp_counter += 1
-        # print('tmp_counter', self.tmp_counter)
-        # # Get the x range that needs to be fetched
-        # needed_ranges = get_needed_x_range(self.view_range[0], view_range[0])
-
-        # # Fetch the needed data
-        # for needed_range in needed_ranges:
-        #     new_x, new_y = generate_data(needed_range[0], needed_range[1])
-        #     # Determine whether the new data goes to the left or right of the
-        #     # existing data
-        #     if needed_range[0] < self.x[0]:
-        #         self.x = np.concatenate([new_x, self.x])
-        #         self.y = np.concatenate([new_y, self.y])
-        #     else:
-        #         self.x = np.concatenate([self.x, new_x])
-        #         self.y = np.concatenate([self.y, new_y])
-
-        # self.x, self.y = generate_data(view_range[0][0],
-        #                                view_range[0][1],
-        #                                align='right',
-        #                                grid=.3)
-
-        # # print(f'len(self.x): {len(self.x)}')
-
-        # # Update the view range
-        # self.view_range = view_range
-
-        # # Update the plot with the new data
-        # self.plot.setData(self.x, self.y)
+        self.update_data_for_new_range(view_range)
 
 
 
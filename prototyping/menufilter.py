@@ -1,17 +1,123 @@
 """
-This module provides a class for filtering and ranking a list of strings based
-on a pattern string.  It is intended to be used in a command palette or similar
-interface where the user types a query string to filter a list of items.
+This module provides functions for filtering and ranking a list of strings
+based on a pattern string.  It is intended to be used in a command palette or
+similar interface where the user types a query string to filter a list of
+items.
+
+A string matches the pattern if it contains the characters of the pattern in
+order (ignoring case). The strings in the list are scored based on how well
+they match the pattern, and the list is filtered and ranked based on these
+scores.
+
+Example usage:
+    items = ["apple", "banana", "cherry", "date"]
+    filtered = filter_list("ae", items)
+    print(filtered)
+
+When the same items are filtered repeatedly (e.g. on every keystroke), they can
+be lowercased once up front with preprocess() and then filtered with
+filter_preprocessed().  This works on ASCII bytes, so non-ASCII characters are
+treated as '?'.
 """
-import re
+
+# Translation table that lowercases ASCII bytes
+_LOWER = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ',
+                         b'abcdefghijklmnopqrstuvwxyz')
+
+def score(string:str, query_lower:str) -> float:
+    """
+    Scores a string based on how well it matches the (lowercased) query
+    string, ignoring case. Returns a score between 0 and 100.  The higher
+    the score, the better the match. Factors that affect the score include
+    the position and length of the match: matches that occur earlier in
+    the string and are shorter score higher.
+
+    The query matches if its characters appear in the string in order.
+    The match is found by searching for each query character in turn,
+    which gives the same match as the regex 'q.*?u.*?e.*?r.*?y' without
+    going through the regex engine.
+    """
+    return score_lowered(string.lower(), query_lower)
+
+def score_lowered(lowered:str|bytes, query_lower:str|bytes) -> float:
+    """
+    Same as score(), but for a string that has already been lowercased.  Both
+    arguments may be str or bytes, as long as they are the same type.
+    """
+    if not query_lower:
+        return 100.0
+    start = -1
+    pos = 0
+    for char in query_lower:
+        pos = lowered.find(char, pos)
+        if pos < 0:
+            return 0
+        if start < 0:
+            start = pos
+        pos += 1
+    # Derive a score based on the position and length of the match
+    pos_match = start + 1  # +1 to avoid division by zero
+    len_match = (pos - start) + 1
+    return 100.0 / (pos_match * len_match)
+
+def rank_list(query:str, items: list[str]) -> list[tuple[str, float]]:
+    """
+    Ranks a list of items based on how well they match the pattern string.
+    Returns a list of tuples with the item and its corresponding score.
+    """
+    query_lower = query.lower()
+    ranked = [(item, score(item, query_lower)) for item in items]
+    ranked.sort(key=lambda x: x[1], reverse=True)
+    return ranked
+
+def preprocess(items:list[str]) -> list[tuple[str, bytes]]:
+    """
+    Pairs each item with its lowercased ASCII bytes, for use with
+    rank_preprocessed() and filter_preprocessed().
+    """
+    return [(item, item.encode('ascii', 'replace').translate(_LOWER))
+            for item in items]
+
+def rank_preprocessed(query:str, items:list[tuple[str, bytes]]
+                      ) -> list[tuple[str, float]]:
+    """
+    Same as rank_list(), for items returned by preprocess().
+    """
+    query_lower = query.encode('ascii', 'replace').translate(_LOWER)
+    ranked = [(item, score_lowered(lowered, query_lower))
+              for item, lowered in items]
+    ranked.sort(key=lambda x: x[1], reverse=True)
+    return ranked
+
+def filter_preprocessed(query:str, items:list[tuple[str, bytes]]) -> list[str]:
+    """
+    Same as filter_list(), for items returned by preprocess().
+    """
+    query_lower = query.encode('ascii', 'replace').translate(_LOWER)
+    scored = [(item, score_lowered(lowered, query_lower))
+              for item, lowered in items]
+    ranked = [(item, item_score) for item, item_score in scored if item_score > 0]
+    ranked.sort(key=lambda x: x[1], reverse=True)
+    return [item for item, _item_score in ranked]
+
+def filter_list(query:str, items:list[str]) -> list[str]:
+    """
+    Filters and ranks a list of items based on how well they match the query
+    string. Returns a list of items that have a non-zero score, sorted by
+    score.
+    """
+    # Discard non-matching items before sorting, rather than sorting the
+    # whole list and then filtering it.
+    query_lower = query.lower()
+    scored = [(item, score(item, query_lower)) for item in items]
+    ranked = [(item, item_score) for item, item_score in scored if item_score > 0]
+    ranked.sort(key=lambda x: x[1], reverse=True)
+    return [item for item, _item_score in ranked]
 
 class MenuFilter:
     """
-    A class for filtering and ranking a list of strings based on a pattern
-    string. The pattern string is used to build a regular expression that
-    matches the pattern. The strings in the list are then scored based on how
-    well they match the pattern, and the list is filtered and ranked based on
-    these scores.
+    Wrapper around the module-level functions, for callers that use the
+    original class-based interface.
 
     Example usage:
         mf = MenuFilter()
@@ -19,50 +125,11 @@ class MenuFilter:
         filtered = mf.filter_list("ae", items)
         print(filtered)
     """
+    # Holds no per-instance state
+    __slots__ = ()
 
-    def __init__(self):
-        pass
-
-    def _build_regex(self, query:str) -> str:
-        """
-        Builds the regular expression for scoring matches.
-        """
-        return '.*?'.join(map(re.escape, list(query)))
-
-    def _score(self, string:str, regex:str, ignorecase:bool=True) -> float:
-        """
-        Scores a string based on how well it matches the pattern string. Returns
-        a score between 0 and 100.  The higher the score, the better the match.
-        Factors that affect the score include the position and length of the
-        match: matches that occur earlier in the string and are longer score
-        higher.
-        """
-        if ignorecase:
-            match = re.search(regex, string, re.IGNORECASE)
-        else:
-            match = re.search(regex, string)
-        if match is None:
-            return 0
-        # Derive a score based on the position and length of the match
-        pos_match = match.start() + 1  # +1 to avoid division by zero
-        len_match = (match.end() - match.start()) + 1
-        return 100.0 / (pos_match * len_match)
-
-    def rank_list(self, query:str, items: list[str]) -> list[tuple[str, float]]:
-        """
-        Ranks a list of items based on how well they match the pattern string.
-        Returns a list of tuples with the item and its corresponding score.
-        """
-        regex = self._build_regex(query)
-        ranked = [(item, self._score(item, regex)) for item in items]
-        ranked.sort(key=lambda x: x[1], reverse=True)
-        return ranked
-
-    def filter_list(self, query:str, items:list[str]) -> list[str]:
-        """
-        Filters and ranks a list of items based on how well they match the query
-        string. Returns a list of items that have a non-zero score, sorted by
-        score.
-        """
-        ranked = self.rank_list(query, items)
-        return [item for item, score in ranked if score > 0]
+    rank_list = staticmethod(rank_list)
+    filter_list = staticmethod(filter_list)
+    preprocess = staticmethod(preprocess)
+    rank_preprocessed = staticmethod(rank_preprocessed)
+    filter_preprocessed = staticmethod(filter_preprocessed)
@@ -3,17 +3,79 @@ Mock-up of a time-series plotting application using PySide6 and pyqtgraph using
 a model / view architecture.
 """
 
+import logging
 import sys
+from contextlib import contextmanager
 
 # pylint: disable=no-name-in-module
-from PySide6.QtCore import Qt, QModelIndex, QPoint
+from PySide6.QtCore import Qt, QModelIndex, QPoint, QTimer
 from PySide6.QtWidgets import (QApplication, QMainWindow, QSplitter, QTreeView,
                                QVBoxLayout, QWidget, QMenu, QInputDialog,
                                QMessageBox)
 from PySide6.QtGui import QStandardItemModel, QStandardItem
 
+import numpy as np
 import pyqtgraph as pg
 
+log = logging.getLogger(__name__)
+
+# tsdownsample is optional.  Without it, downsample() falls back to keeping the
+# minimum and maximum of each bucket.
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+except ImportError:
+    MinMaxLTTBDownsampler = None
+
+# Draw the plots with OpenGL if PyOpenGL, which pyqtgraph needs for it, is
+# installed.  Otherwise use Qt's raster painter.
+try:
+    import OpenGL  # pylint: disable=unused-import
+    USE_OPENGL = True
+except ImportError:
+    USE_OPENGL = False
+
+# Item data role that holds the kind of a tree item: "plot" or "curve"
+KIND_ROLE = Qt.UserRole
+# Item data role that holds the pg.PlotWidget of a plot item
+PLOT_WIDGET_ROLE = Qt.UserRole + 1
+
+# Qt enum values used by the MainWindow handlers.  Binding them here avoids an
+# attribute lookup on the Qt wrapper types for each use.
+_YES = QMessageBox.Yes
+_NO = QMessageBox.No
+_CUSTOM_CONTEXT_MENU = Qt.CustomContextMenu
+_EDIT_TRIGGERS = QTreeView.DoubleClicked | QTreeView.EditKeyPressed
+
+def downsample(x, y, n_out):
+    """
+    Returns about n_out of the points in (x, y), chosen to preserve the shape
+    of the curve.  x must be sorted.  Returns the data unchanged if it has no
+    more than n_out points.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 4:
+        return x, y
+    if MinMaxLTTBDownsampler is not None:
+        indices = MinMaxLTTBDownsampler().downsample(x, y, n_out=n_out)
+        return x[indices], y[indices]
+
+    # Split the data into n_out / 2 equal buckets and keep the minimum and
+    # maximum of each, plus the first and last points.  The points left over
+    # after the equal buckets form one more, shorter bucket.
+    buckets = n_out // 2
+    size = n // buckets
+    end = buckets * size
+    offsets = np.arange(buckets) * size
+    binned = y[:end].reshape(buckets, size)
+    parts = [[0],
+             offsets + binned.argmin(axis=1),
+             offsets + binned.argmax(axis=1),
+             [n - 1]]
+    if end < n:
+        parts.append([end + y[end:].argmin(), end + y[end:].argmax()])
+    indices = np.unique(np.concatenate(parts))
+    return x[indices], y[indices]
+
 class PlotManager(QWidget):
     """Widget to hold multiple pyqtgraph plots and link their x-axes."""
     
@@ -23,12 +85,32 @@ class PlotManager(QWidget):
         self.plots = []
         self.first_plot = None  # Reference to the first plot for x-axis linking
 
+        # Panning one plot changes the x range of every linked plot, once per
+        # mouse move.  Rather than re-downsampling on each change, refresh all
+        # the plots at most once every 50 ms.
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(50)
+        self.refresh_timer.timeout.connect(self.refresh_all_plots)
+
     def add_plot(self, name):
         """Add a new plot to the widget and link its x-axis to the first plot."""
         plot = pg.PlotWidget(title=name)
+        if USE_OPENGL:
+            plot.useOpenGL(True)
+        # Only draw the data inside the view, thinned out to about one point
+        # per pixel when zoomed out.  Curves added with plot.plot() pick these
+        # settings up from the plot item.  Curves added with add_curve() turn
+        # them off, because add_curve() downsamples the data itself.
+        plot.setClipToView(True)
+        plot.setDownsampling(auto=True, mode='peak')
+        plot.getPlotItem().setMenuEnabled(False)
         self.layout.addWidget(plot)
         self.plots.append(plot)
 
+        # Re-downsample the curves added with add_curve() when the view changes
+        plot.getPlotItem().sigXRangeChanged.connect(self.on_x_range_changed)
+
         # Link x-axis to the first plot's x-axis if it exists
         if self.first_plot is None:
             self.first_plot = plot
@@ -37,10 +119,93 @@ class PlotManager(QWidget):
         
         return plot
 
+    def add_plots(self, names):
+        """
+        Add several plots at once.  Updates are disabled while the plots are
+        added so that the widget is laid out and repainted once, not once per
+        plot.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            return [self.add_plot(name) for name in names]
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def add_curve(self, plot, x, y, **kwargs):
+        """
+        Add a curve to a plot.  The full data is kept on the curve as x_full and
+        y_full, and pyqtgraph is only given a downsampled copy of the part that
+        is in view, which is recomputed when the view changes.  kwargs are
+        passed to plot.plot().
+        """
+        curve = plot.plot(**kwargs)
+        # Downsampling and clipping are done here instead of by pyqtgraph
+        curve.setDownsampling(auto=False)
+        curve.setClipToView(False)
+        curve.x_full = np.asarray(x, dtype=float)
+        curve.y_full = np.asarray(y, dtype=float)
+
+        # pyqtgraph only sees the part of the data that is in view, so it
+        # can't auto-range the x axis to the whole curve.  Show the full data
+        # of all the (linked) plots instead.
+        full_range = self.full_x_range()
+        if full_range is not None:
+            plot.setXRange(*full_range)
+
+        self.refresh_curve(curve, plot.getPlotItem().viewRange()[0], plot.width())
+        return curve
+
+    def full_x_range(self):
+        """
+        Returns the x range [x_min, x_max] covered by the full data of the
+        curves added with add_curve(), or None if there is no such data.
+        """
+        ranges = [(curve.x_full[0], curve.x_full[-1])
+                  for plot in self.plots
+                  for curve in plot.listDataItems()
+                  if hasattr(curve, 'x_full') and len(curve.x_full)]
+        if not ranges:
+            return None
+        return [min(r[0] for r in ranges), max(r[1] for r in ranges)]
+
+    def on_x_range_changed(self, _view_box, _x_range):
+        """
+        Schedule a refresh of all plots, unless one is already scheduled.  The
+        refresh reads each plot's range when it runs, so it sees the latest one.
+        """
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+
+    def refresh_all_plots(self):
+        """Update the downsampled data of every plot for its current x range."""
+        for plot in self.plots:
+            self.refresh_plot(plot, plot.getPlotItem().viewRange()[0])
+
+    def refresh_plot(self, plot, x_range):
+        """Update the downsampled data of the curves in a plot for x_range."""
+        for curve in plot.listDataItems():
+            if hasattr(curve, 'x_full'):
+                self.refresh_curve(curve, x_range, plot.width())
+
+    def refresh_curve(self, curve, x_range, width):
+        """
+        Hand pyqtgraph a downsampled copy of the part of the curve's data within
+        x_range, with about four points per pixel of width.
+        """
+        start, stop = np.searchsorted(curve.x_full, x_range)
+        # Include a point either side so that the line runs to the edges
+        start = max(start - 1, 0)
+        stop = min(stop + 1, len(curve.x_full))
+        x, y = downsample(curve.x_full[start:stop], curve.y_full[start:stop],
+                          4 * max(width, 100))
+        curve.setData(x, y)
+
     def remove_plot(self, index):
         """Remove a plot by index."""
         plot = self.plots.pop(index)
-        self.layout.removeWidget(plot)
+        # The layout holds only the plots, in the same order as self.plots, so
+        # take the item by index instead of having removeWidget() search for it.
+        self.layout.takeAt(index)
         plot.deleteLater()
 
 class TreeModel(QStandardItemModel):
@@ -50,18 +215,53 @@ class TreeModel(QStandardItemModel):
         super().__init__()
         self.setHorizontalHeaderLabels(['Plots and Curves'])
 
-    def add_plot(self, name):
-        """Add a new plot entry to the tree."""
+    @staticmethod
+    def new_plot_item(name, plot_widget=None):
+        """
+        Create the tree item for a plot.  plot_widget is the plot's
+        pg.PlotWidget, which is stored in the item's PLOT_WIDGET_ROLE data.
+        """
         plot_item = QStandardItem(name)
         plot_item.setEditable(True)  # Allow the plot name to be edited
+        plot_item.setData("plot", KIND_ROLE)
+        plot_item.setData(plot_widget, PLOT_WIDGET_ROLE)
+        return plot_item
+
+    def add_plot(self, name, plot_widget=None):
+        """Add a new plot entry to the tree."""
+        plot_item = self.new_plot_item(name, plot_widget)
         self.appendRow(plot_item)
         return plot_item
 
+    def add_plots_bulk(self, names, plot_widgets):
+        """
+        Add several plot entries to the tree at once.  The rows are inserted
+        with a single appendRows call, so attached views are notified once for
+        the whole batch rather than once per plot.
+        """
+        plot_items = [self.new_plot_item(name, plot_widget)
+                      for name, plot_widget in zip(names, plot_widgets)]
+        self.invisibleRootItem().appendRows(plot_items)
+        return plot_items
+
+    @staticmethod
+    def new_curve_item(name):
+        """Create the tree item for a curve."""
+        curve_item = QStandardItem(name)
+        curve_item.setEditable(False)  # Curves are not editable
+        curve_item.setData("curve", KIND_ROLE)
+        return curve_item
+
     def add_curve(self, plot_item, curve_name):
         """Add a curve under the plot entry."""
-        curve_item = QStandardItem(curve_name)
-        curve_item.setEditable(False)  # Curves are not editable
-        plot_item.appendRow(curve_item)
+        plot_item.appendRow(self.new_curve_item(curve_name))
+
+    def add_curves(self, plot_item, names):
+        """
+        Add several curves under the plot entry with a single appendRows call,
+        so attached views are notified once for the whole batch.
+        """
+        plot_item.appendRows([self.new_curve_item(name) for name in names])
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -83,60 +283,70 @@ class MainWindow(QMainWindow):
 
         splitter.setStretchFactor(1, 1)  # Make the plot area expand more
 
-        # Initialize with some plots and curves
-        self.initialize_plots()
+        # Initialize with some plots and curves.  Creating the plots is slow,
+        # so do it once the event loop is running, letting the window appear
+        # first.
+        QTimer.singleShot(0, self.initialize_plots)
 
         # Set up context menu for the tree view
-        self.tree_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.tree_view.setContextMenuPolicy(_CUSTOM_CONTEXT_MENU)
         self.tree_view.customContextMenuRequested.connect(self.open_context_menu)
 
         # Connect the tree view to handle selections
         self.tree_view.selectionModel().currentChanged.connect(self.on_tree_selection_changed)
 
         # Enable double-click to edit the plot names in place
-        self.tree_view.setEditTriggers(QTreeView.DoubleClicked | QTreeView.EditKeyPressed)
+        self.tree_view.setEditTriggers(_EDIT_TRIGGERS)
 
         self.model.dataChanged.connect(self.on_item_changed)
 
     def on_item_changed(self, top_left: QModelIndex, bottom_right: QModelIndex):
         """Update the pyqtgraph plot title when an item in the tree view is renamed."""
-        item = self.model.itemFromIndex(top_left)
-        
-        # Check if the item is a plot (parent is None)
-        if item and item.parent() is None:
-            plot_index = top_left.row()  # Get the index of the plot
-            new_plot_name = item.text()  # Get the new plot name
-            
-            # Update the corresponding plot's title in the PlotManager
-            plot_widget = self.plot_manager.plots[plot_index]
-            plot_widget.setTitle(new_plot_name)
-
+        # Only plot items have a plot widget
+        plot_widget = top_left.data(PLOT_WIDGET_ROLE)
+        if plot_widget is not None:
+            plot_widget.setTitle(top_left.data())
+
+
+    @contextmanager
+    def bulk_update(self):
+        """
+        Context manager that stops the tree view repainting while the model is
+        changed in several steps, and repaints it once at the end.
+        """
+        self.tree_view.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.tree_view.setUpdatesEnabled(True)
+            self.tree_view.viewport().update()
 
     def initialize_plots(self):
         """Create some initial plots and curves."""
-        plot1_item = self.model.add_plot("Plot 1")
-        plot1 = self.plot_manager.add_plot("Plot 1")
-        self.model.add_curve(plot1_item, "Curve 1")
-        plot1.plot([0, 1, 2, 3], [10, 20, 10, 30], pen='r')  # Red curve
-
-        plot2_item = self.model.add_plot("Plot 2")
-        plot2 = self.plot_manager.add_plot("Plot 2")
-        self.model.add_curve(plot2_item, "Curve 1")
-        self.model.add_curve(plot2_item, "Curve 2")
-        plot2.plot([0, 1, 2, 3], [30, 40, 20, 10], pen='g')  # Green curve
-        plot2.plot([0, 1, 2, 3], [15, 25, 35, 5], pen='b')   # Blue curve
+        with self.bulk_update():
+            names = ["Plot 1", "Plot 2"]
+            plot1, plot2 = self.plot_manager.add_plots(names)
+            plot1_item, plot2_item = self.model.add_plots_bulk(names, [plot1, plot2])
+
+            self.model.add_curve(plot1_item, "Curve 1")
+            self.plot_manager.add_curve(plot1, [0, 1, 2, 3], [10, 20, 10, 30], pen='r')  # Red curve
+
+            self.model.add_curves(plot2_item, ["Curve 1", "Curve 2"])
+            self.plot_manager.add_curve(plot2, [0, 1, 2, 3], [30, 40, 20, 10], pen='g')  # Green curve
+            self.plot_manager.add_curve(plot2, [0, 1, 2, 3], [15, 25, 35, 5], pen='b')   # Blue curve
 
     def on_tree_selection_changed(self, current: QModelIndex, previous: QModelIndex):
         """Handle tree view selection changes to highlight the selected plot/curve."""
-        selected_item = self.model.itemFromIndex(current)
-        if selected_item:
-            # Handle when a plot or curve is selected
-            if selected_item.parent() is None:
+        if current.isValid():
+            # Handle when a plot or curve is selected.  Read straight from the
+            # index rather than looking up the item.
+            if current.data(KIND_ROLE) == "plot":
                 # A plot is selected
-                print(f"Selected plot: {selected_item.text()}")
+                log.debug("Selected plot: %s", current.data())
             else:
                 # A curve under a plot is selected
-                print(f"Selected curve: {selected_item.text()} (under {selected_item.parent().text()})")
+                log.debug("Selected curve: %s (under %s)", current.data(),
+                          current.parent().data())
 
     def open_context_menu(self, position: QPoint):
         """Create and open the context menu when right-clicking on the tree view."""
@@ -167,10 +377,10 @@ class MainWindow(QMainWindow):
         """Add a new plot both to the model and plot manager."""
         plot_name, ok = QInputDialog.getText(self, "Add Plot", "Enter plot name:")
         if ok and plot_name:
-            # Add to tree model
-            plot_item = self.model.add_plot(plot_name)
             # Add to plot manager
-            self.plot_manager.add_plot(plot_name)
+            plot_widget = self.plot_manager.add_plot(plot_name)
+            # Add to tree model
+            self.model.add_plot(plot_name, plot_widget)
 
     def rename_plot(self, plot_item):
         """Rename an existing plot by entering inline edit mode."""
@@ -183,17 +393,23 @@ class MainWindow(QMainWindow):
     def delete_plot(self, plot_item):
         """Delete a plot from the model and the plot manager."""
         reply = QMessageBox.question(self, 'Delete Plot', f"Are you sure you want to delete '{plot_item.text()}'?",
-                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+                                     _YES | _NO, _NO)
 
-        if reply == QMessageBox.Yes:
-            # Find the index of the plot in the model
-            index = self.model.indexFromItem(plot_item).row()
-            # Remove from plot manager
-            self.plot_manager.remove_plot(index)
-            # Remove from model
-            self.model.removeRow(index)
+        if reply == _YES:
+            with self.bulk_update():
+                # Find the index of the plot in the model
+                index = self.model.indexFromItem(plot_item).row()
+                # Remove from plot manager
+                self.plot_manager.remove_plot(index)
+                # Remove from model
+                self.model.removeRow(index)
 
 if __name__ == "__main__":
+    # Antialiased lines are much slower to draw.  OpenGL itself is turned on
+    # for each plot in PlotManager.add_plot; enableExperimental selects
+    # pyqtgraph's OpenGL curve drawing.
+    pg.setConfigOptions(antialias=False, enableExperimental=USE_OPENGL)
+
     app = QApplication(sys.argv)
     
     # Create and show the main window
@@ -35,6 +35,7 @@ Usage:
 
 
 import sys
+from contextlib import contextmanager
 
 # pylint: disable=no-name-in-module
 from PySide6.QtWidgets import (
@@ -130,6 +131,7 @@ class MainWindow(QMainWindow):
 
         # Create tab names and initialize the TreeModel with them
         self.tabs = ["Tab 1", "Tab 2", "Tab 3"]
+        self.reindex_tabs()
         self.tree_model = TreeModel(self.tabs)
         self.tree_view.setModel(self.tree_model)
 
@@ -153,14 +155,40 @@ class MainWindow(QMainWindow):
         print(f"Showing properties for tabs: {', '.join(tab_names)}")
         # Implement the properties dialog here
 
+    def reindex_tabs(self):
+        """
+        Rebuilds the mapping from tab name to index in self.tabs, which is used
+        to look up tabs on every selection change.  If names are repeated, the
+        first tab with the name is used.
+        """
+        self._tab_index = {}
+        for index, tab_name in enumerate(self.tabs):
+            self._tab_index.setdefault(tab_name, index)
+
+    @contextmanager
+    def bulk_update(self):
+        """
+        Context manager that stops the tree view repainting while the model is
+        changed in several steps, and repaints it once at the end.
+        """
+        self.tree_view.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.tree_view.setUpdatesEnabled(True)
+            self.tree_view.viewport().update()
+
     def move_tab(self, from_index, to_index):
         """Reorders the tabs and updates the tree view accordingly."""
         # Move the tab name in the internal tabs list
         self.tabs.insert(to_index, self.tabs.pop(from_index))
+        self.reindex_tabs()
 
-        # Move the corresponding item in the tree model
-        item = self.tree_model.takeRow(from_index)
-        self.tree_model.insertRow(to_index, item)
+        # Move the corresponding item in the tree model.  Don't let the tree
+        # view repaint between taking the row and putting it back.
+        with self.bulk_update():
+            item = self.tree_model.takeRow(from_index)
+            self.tree_model.insertRow(to_index, item)
 
     def create_tab(self, tab_name):
         """Creates a simple QWidget containing a label for each tab."""
@@ -178,7 +206,7 @@ class MainWindow(QMainWindow):
             index = indexes[0]
             tab_name = self.tree_model.itemFromIndex(index).text()
             # Find the index of the tab by name and set it as current
-            tab_index = self.tabs.index(tab_name)
+            tab_index = self._tab_index[tab_name]
             self.tab_widget.setCurrentIndex(tab_index)
 
     def on_item_changed(self, item):
@@ -191,6 +219,7 @@ class MainWindow(QMainWindow):
 
         # Update the name in the internal tabs list
         self.tabs[tab_index] = new_tab_name
+        self.reindex_tabs()
 
     def add_tab(self):
         """
@@ -202,6 +231,7 @@ class MainWindow(QMainWindow):
             if new_tab_name not in self.tabs:
                 break
         self.tabs.append(new_tab_name)
+        self._tab_index.setdefault(new_tab_name, len(self.tabs) - 1)
 
         # Add a new item to the tree view model
         item = QStandardItem(new_tab_name)
@@ -219,6 +249,7 @@ class MainWindow(QMainWindow):
             self.tab_widget.removeTab(index)
             self.tree_model.removeRow(index)
             del self.tabs[index]
+            self.reindex_tabs()
 
     def edit_tree_item_from_tab(self, tab_index):
         """Put the corresponding tree view item into edit mode based on the tab index."""
@@ -1,46 +1,58 @@
 """
-This script demonstrates how to use the concurrent.futures module to run a
-long-running task in a separate thread and update the progress in the main
-thread using signals.
+This script demonstrates how to use Qt's global thread pool (QThreadPool and
+QRunnable) to run a long-running task in a separate thread and update the
+progress in the main thread using signals.
 """
 
 import sys
 import time
-import concurrent.futures
 
 # pylint: disable=no-name-in-module
-from PySide6.QtCore import Signal, QObject
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget, QProgressBar, QLabel
 )
 
-class Worker(QObject):
-    progress = Signal(int)
-
-    def __init__(self):
+class Task(QRunnable):
+    """
+    The long-running task.  Runs in a thread from Qt's global thread pool and
+    reports through the signals of the Worker that started it.
+    """
+    def __init__(self, worker):
         super().__init__()
-        self.executor = concurrent.futures.ThreadPoolExecutor()
+        self.worker = worker
 
-    def start_task(self):
-        future = self.executor.submit(self.long_running_task)
-        future.add_done_callback(self.task_finished)
+    def run(self):
+        self.long_running_task()
+        self.worker.finished.emit()
 
     def long_running_task(self):
-        for i in range(100):
-            time.sleep(0.1)  # Simulate a time-consuming task
-            self.progress.emit(i + 1)
+        # Each emit is a queued call into the GUI thread, so only report every
+        # fifth of the 100 steps.  Simulate the work for a batch of steps by
+        # sleeping until the time the batch should finish, measured from the
+        # start, so that the lateness of one sleep doesn't carry over into the
+        # next.
+        start = time.perf_counter()
+        for step in range(5, 101, 5):
+            time.sleep(max(start + step * 0.1 - time.perf_counter(), 0))
+            self.worker.progress.emit(step)
 
-    def task_finished(self, _future):
-        """
-        Callback function that is called when the task is finished
-        """
-        self.progress.emit(100)
+class Worker(QObject):
+    """
+    Owns the signals that a Task reports through.  QRunnable isn't a QObject,
+    so it can't have signals of its own.
+    """
+    progress = Signal(int)
+    finished = Signal()
+
+    def start_task(self):
+        QThreadPool.globalInstance().start(Task(self))
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        self.setWindowTitle("concurrent.futures Example")
+        self.setWindowTitle("QThreadPool Example")
         self.setGeometry(300, 300, 400, 200)
 
         # Layout and widgets
@@ -59,7 +71,10 @@ class MainWindow(QMainWindow):
 
         # Initialize the worker
         self.worker = Worker()
-        self.worker.progress.connect(self.update_progress)
+        # The signals are emitted from a pool thread, so make sure the slots
+        # run in the GUI thread.
+        self.worker.progress.connect(self.update_progress, Qt.QueuedConnection)
+        self.worker.finished.connect(self.task_finished, Qt.QueuedConnection)
 
         # Connect button click to start task
         self.start_button.clicked.connect(self.start_task)
@@ -72,9 +87,11 @@ class MainWindow(QMainWindow):
 
     def update_progress(self, value):
         self.progress_bar.setValue(value)
-        if value == 100:
-            self.status_label.setText("Status: Finished")
-            self.start_button.setEnabled(True)
+
+    def task_finished(self):
+        self.status_label.setText("Status: Finished")
+        self.start_button.setEnabled(True)
+        self.progress_bar.setValue(100)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
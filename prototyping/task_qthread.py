@@ -15,9 +15,15 @@ class WorkerThread(QThread):
     progress_updated = Signal(int)
 
     def run(self):
-        for i in range(100):
-            time.sleep(0.1)  # Simulate a time-consuming task
-            self.progress_updated.emit(i + 1)  # Emit progress signal
+        # Each emit is a queued call into the GUI thread, so only report every
+        # fifth of the 100 steps.  Simulate the work for a batch of steps by
+        # sleeping until the time the batch should finish, measured from the
+        # start, so that the lateness of one sleep doesn't carry over into the
+        # next.
+        start = time.perf_counter()
+        for step in range(5, 101, 5):
+            time.sleep(max(start + step * 0.1 - time.perf_counter(), 0))
+            self.progress_updated.emit(step)
 
 class MainWindow(QMainWindow):
     def __init__(self):